@@ -10,8 +10,10 @@ extras_require = {
 				'standard-imghdr==3.10.14; python_version >= "3.13"'
 				],
 		"testing": ["pytest"],
+		"fastjsonschema": ["fastjsonschema>=2.14.0"],
 		"all": [
 				"docutils",
+				"fastjsonschema>=2.14.0",
 				"pytest",
 				"sphinx<3.4.0,>=3.0.3",
 				"sphinx-toolbox",
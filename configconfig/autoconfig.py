@@ -70,8 +70,10 @@ API Reference
 #
 
 # stdlib
+import functools
 import warnings
-from typing import Any, Dict, List, Sequence, Type
+from types import ModuleType
+from typing import Any, Dict, List, Sequence, Tuple, Type
 
 # 3rd party
 from docutils import nodes  # nodep
@@ -93,6 +95,25 @@ __all__ = ["AutoConfigDirective", "conf_node_purger", "parse_conf_node", "setup"
 
 conf_node_purger = Purger("all_conf_nodes")
 
+# Comment placed between the documentation for each ConfigVar when several are parsed at once.
+_separator = ".. autoconfig-separator"
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_import_module(name: str) -> ModuleType:
+	return import_module(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_import_object(module_name: str, class_: str) -> Any:
+	return import_object(module_name, [class_])[3]
+
+
+@functools.lru_cache(maxsize=512)
+def _docstring_lines(docstring: str) -> Tuple[str, ...]:
+	# Only '\n' ends a line, and each tab becomes four spaces wherever it is in the line.
+	return tuple(line.replace('\t', "    ") for line in docstring.split('\n'))
+
 
 class AutoConfigDirective(SphinxDirective):
 	"""
@@ -113,8 +134,7 @@ class AutoConfigDirective(SphinxDirective):
 		config_var: str = self.arguments[0]
 
 		if "category" in self.options:
-			node_list = []
-			module = import_module(config_var)
+			module = _cached_import_module(config_var)
 
 			if hasattr(module, "__all__"):
 				module_all = module.__all__
@@ -135,24 +155,82 @@ class AutoConfigDirective(SphinxDirective):
 			# 			config_node = nodes.paragraph(rawsource=content)
 			# 			self.state.nested_parse(view, self.content_offset, config_node)
 
+			var_objs: List[Type[ConfigVar]] = []
+
 			for class_ in module_all:
 				var_obj: Type[ConfigVar] = getattr(module, class_)
 
 				if not (isinstance(var_obj, ConfigVarMeta) and issubclass(var_obj, ConfigVar)):
 					continue  # pragma: no cover
 				elif var_obj.category == category:
-					node_list.append(self.document_config_var(var_obj))
+					var_objs.append(var_obj)
 
-			return node_list
+			return self.document_config_vars(var_objs)
 
 		else:
-			module_name, class_ = config_var.rsplit('.', 1)
-			var_obj = import_object(module_name, [class_])[3]
-			if not issubclass(var_obj, ConfigVar):
+			obj: Any = ConfigVarMeta._registry.get(config_var)
+
+			if obj is None:
+				module_name, class_ = config_var.rsplit('.', 1)
+				obj = _cached_import_object(module_name, class_)
+
+			if not (isinstance(obj, ConfigVarMeta) and issubclass(obj, ConfigVar)):
 				warnings.warn("'autoconfig' can only be used with 'ConfigVar' subclasses.")
 				return []
 
-			return [self.document_config_var(var_obj)]
+			return [self.document_config_var(obj)]
+
+	def document_config_vars(self, var_objs: Sequence[Type[ConfigVar]]) -> List[nodes.paragraph]:
+		"""
+		Document the given configuration values.
+
+		The documentation for all of the values is parsed at once,
+		and then split into a separate node for each value.
+
+		:param var_objs:
+		"""
+
+		if not var_objs:
+			return []
+
+		docstrings = []
+		view = StringList()
+
+		for var_obj in var_objs:
+			docstring = var_obj.make_documentation()
+			docstrings.append(docstring)
+			view.extend(StringList(list(_docstring_lines(docstring))))
+			view.extend(StringList(['', _separator, '']))
+
+		container = nodes.container()
+		self.state.nested_parse(view, self.content_offset, container)
+
+		groups: List[List[nodes.Node]] = [[]]
+		for child in container.children:
+			if isinstance(child, nodes.comment) and child.astext() == _separator[3:]:
+				groups.append([])
+			else:
+				groups[-1].append(child)
+
+		# The trailing separator leaves an empty group at the end.
+		groups.pop()
+
+		if len(groups) != len(var_objs):  # pragma: no cover
+			# A docstring contained something that looked like the separator.
+			return [self.document_config_var(var_obj) for var_obj in var_objs]
+
+		node_list = []
+
+		for docstring, children in zip(docstrings, groups):
+			config_node = nodes.paragraph(rawsource=docstring)
+			config_node.extend(children)
+
+			if config_node.children:
+				self._add_target(config_node)
+
+			node_list.append(config_node)
+
+		return node_list
 
 	def document_config_var(self, var_obj: Type[ConfigVar]) -> nodes.paragraph:
 		"""
@@ -163,18 +241,21 @@ class AutoConfigDirective(SphinxDirective):
 
 		docstring = var_obj.make_documentation()
 
-		targetid = f'autoconfig-{self.env.new_serialno("autoconfig"):d}'
-		targetnode = nodes.section(ids=[targetid])
-
-		content = docstring.replace('\t', "    ")
-		view = StringList(content.split('\n'))
-		config_node = nodes.paragraph(rawsource=content)
+		view = StringList(list(_docstring_lines(docstring)))
+		config_node = nodes.paragraph(rawsource=docstring)
 		self.state.nested_parse(view, self.content_offset, config_node)
 
-		conf_node_purger.add_node(self.env, config_node, targetnode, self.lineno)
+		if config_node.children:
+			self._add_target(config_node)
 
 		return config_node
 
+	def _add_target(self, config_node: nodes.paragraph) -> None:
+		# Register the node with the purger, with a unique target.
+		targetid = f'autoconfig-{self.env.new_serialno("autoconfig"):d}'
+		targetnode = nodes.section(ids=[targetid])
+		conf_node_purger.add_node(self.env, config_node, targetnode, self.lineno)
+
 
 def parse_conf_node(env: BuildEnvironment, text: str, node: addnodes.desc_signature) -> str:
 	"""
@@ -185,18 +266,24 @@ def parse_conf_node(env: BuildEnvironment, text: str, node: addnodes.desc_signat
 	:param node: The docutils node class.
 	"""
 
-	args = text.split('^')
-	name = args[0].strip()
+	head, sep, rest = text.partition('^')
+	name = head.strip()
 
 	node += addnodes.literal_strong(name, name)
 
-	if len(args) > 2:
-		default = f"={args[2].strip()}"
+	if not sep:
+		# Only the name was given
+		return name
+
+	middle, sep, tail = rest.partition('^')
+
+	if sep:
+		# Anything after a third caret is ignored.
+		default = f"={tail.partition('^')[0].strip()}"
 		node += nodes.literal(text=default)
 
-	if len(args) > 1:
-		content = f"({args[1].strip()})"
-		node += addnodes.compact_paragraph(text=content)
+	content = f"({middle.strip()})"
+	node += addnodes.compact_paragraph(text=content)
 
 	return name  # this will be the link
 
@@ -214,6 +301,16 @@ def _get_outdated(
 	return [todo["docname"] for todo in getattr(env, conf_node_purger.attr_name)]
 
 
+def _clear_documentation_cache(app: Sphinx, exception: Any) -> None:
+	ConfigVar.make_documentation.cache_clear()
+	_docstring_lines.cache_clear()
+
+
+def _clear_import_cache(app: Sphinx, exception: Any) -> None:
+	_cached_import_module.cache_clear()
+	_cached_import_object.cache_clear()
+
+
 def setup(app: Sphinx) -> Dict[str, Any]:
 	"""
 	Setup Sphinx Extension.
@@ -224,6 +321,8 @@ def setup(app: Sphinx) -> Dict[str, Any]:
 	app.add_directive("autoconfig", AutoConfigDirective)
 	app.connect("env-purge-doc", conf_node_purger.purge_nodes)
 	app.connect("env-get-outdated", _get_outdated)
+	app.connect("build-finished", _clear_documentation_cache)
+	app.connect("build-finished", _clear_import_cache)
 
 	app.add_object_type(
 			directivename="conf",
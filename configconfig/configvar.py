@@ -27,20 +27,70 @@ Base class for ``YAML`` configuration values.
 #
 
 # stdlib
-from textwrap import dedent, indent
-from typing import Any, Callable, Optional, Type, Union
-
-# 3rd party
-from domdf_python_tools.stringlist import StringList
-from typing_inspect import is_literal_type  # type: ignore[import]
+import functools
+from typing import Any, Callable, Dict, Optional, Type, Union
 
 # this package
 from configconfig.metaclass import ConfigVarMeta
-from configconfig.utils import RawConfigVarsType, get_yaml_type, tab
+from configconfig.utils import RawConfigVarsType, get_yaml_type
 from configconfig.validator import Validator
 
 __all__ = ["ConfigVar"]
 
+# Fields of the generated documentation which do not depend on the ConfigVar.
+_REQUIRED_YES = "**Required**: yes"
+_REQUIRED_NO = "**Required**: no"
+_DEFAULT_EMPTY_LIST = "**Default**: [ ]"
+_DEFAULT_EMPTY_DICT = "**Default**: { }"
+_DEFAULT_BLANK = "**Default**: <blank>"
+
+
+def _format_list_default(default: list) -> str:
+	return f"**Default**: {default}" if default else _DEFAULT_EMPTY_LIST
+
+
+def _format_dict_default(default: dict) -> str:
+	return f"**Default**: {default}" if default else _DEFAULT_EMPTY_DICT
+
+
+def _format_bool_default(default: bool) -> str:
+	return f"**Default**: :py:obj:`{default}`"
+
+
+def _format_str_default(default: str) -> str:
+	return f"**Default**: ``{default}``" if default else _DEFAULT_BLANK
+
+
+# Mapping of the type of a ConfigVar's default to the function used to document it.
+_DEFAULT_FORMATTERS: Dict[type, Callable[[Any], str]] = {
+		list: _format_list_default,
+		dict: _format_dict_default,
+		bool: _format_bool_default,
+		str: _format_str_default,
+		}
+
+
+def _format_default(default: Any) -> str:
+	"""
+	Returns the ``Default`` field of the documentation for a :class:`~.ConfigVar` with the given default.
+
+	:param default:
+	"""
+
+	formatter = _DEFAULT_FORMATTERS.get(type(default))
+	if formatter is not None:
+		return formatter(default)
+
+	if callable(default):
+		return f"**Default**: The value of :conf:`{default.__name__}`"
+
+	# Subclasses of the types above
+	for type_, formatter in _DEFAULT_FORMATTERS.items():
+		if isinstance(default, type_):
+			return formatter(default)
+
+	return f"**Default**: {default}"
+
 
 class ConfigVar(metaclass=ConfigVarMeta):
 	"""
@@ -151,73 +201,38 @@ class ConfigVar(metaclass=ConfigVarMeta):
 		:rtype: See the :attr:`~.ConfigVar.rtype` attribute.
 		"""
 
-		if raw_config_vars is None:
-			raw_config_vars = {}
-
-		if cls.rtype is None:
-			cls.rtype = cls.dtype
-
-		validator = Validator(cls)
-		return validator.validate(raw_config_vars)
+		# Validator.validate treats None as an empty mapping.
+		return Validator(cls).validate(raw_config_vars)
 
 	@classmethod
+	@functools.lru_cache(maxsize=None)
 	def make_documentation(cls) -> str:
 		"""
 		Returns the reStructuredText documentation for the :class:`~.ConfigVar`.
+
+		The result is cached for each :class:`~.ConfigVar`.
+		Call ``ConfigVar.make_documentation.cache_clear()`` to discard the cached values.
 		"""
 
-		docstring = cls.__doc__ or ''
-		docstring = (indent(dedent(docstring), tab))
+		lines = ['', f".. conf:: {cls.__name__}"]
+		lines.extend(line.rstrip() for line in cls._doc_indented.split('\n'))
+		lines.append('')
 
-		if not docstring.startswith('\n'):
-			docstring = '\n' + docstring
+		fields = [_REQUIRED_YES if cls.required else _REQUIRED_NO]
 
-		buf = StringList()
-		buf.indent_type = "    "
-		buf.blankline(ensure_single=True)
-		buf.append(f".. conf:: {cls.__name__}")
-		buf.append(docstring)
-		buf.blankline()
+		if not cls.required:
+			fields.append(_format_default(cls.default))
 
-		buf.indent_size += 1
+		fields.append(f"**Type**: {get_yaml_type(cls.dtype)}")
 
-		buf.append(f"**Required**: {'yes' if cls.required else 'no'}")
-		buf.blankline()
-		buf.blankline()
+		if cls._dtype_kind == "literal":
+			valid_values = ", ".join(f"``{x}``" for x in cls._dtype_args)
+			fields.append(f"**Allowed values**: {valid_values}")
+		elif cls._dtype_inner_is_literal:
+			valid_values = ", ".join(f"``{x}``" for x in cls._dtype_inner_args)
+			fields.append(f"**Allowed values**: {valid_values}")
 
-		if not cls.required:
-			if cls.default == []:
-				buf.append("**Default**: [ ]")
-			elif cls.default == {}:
-				buf.append("**Default**: { }")
-			elif isinstance(cls.default, Callable):  # type: ignore[arg-type]
-				buf.append(f"**Default**: The value of :conf:`{cls.default.__name__}`")
-			elif isinstance(cls.default, bool):
-				buf.append(f"**Default**: :py:obj:`{cls.default}`")
-			elif isinstance(cls.default, str):
-				if cls.default == '':
-					buf.append("**Default**: <blank>")
-				else:
-					buf.append(f"**Default**: ``{cls.default}``")
-			else:
-				buf.append(f"**Default**: {cls.default}")
-
-			buf.blankline()
-			buf.blankline()
-
-		buf.append(f"**Type**: {get_yaml_type(cls.dtype)}")
-
-		if is_literal_type(cls.dtype):
-			valid_values = ", ".join(f"``{x}``" for x in cls.dtype.__args__)
-			buf.blankline()
-			buf.blankline()
-			buf.append(f"**Allowed values**: {valid_values}")
-		elif hasattr(cls.dtype, "__args__") and is_literal_type(cls.dtype.__args__[0]):
-			valid_values = ", ".join(f"``{x}``" for x in cls.dtype.__args__[0].__args__)
-			buf.blankline()
-			buf.blankline()
-			buf.append(f"**Allowed values**: {valid_values}")
-
-		buf.indent_size -= 1
-
-		return str(buf)
+		# The fields are indented by four spaces and separated by two blank lines.
+		lines.extend(f"    {line}".rstrip() for line in "\n\n\n".join(fields).split('\n'))
+
+		return '\n'.join(lines)
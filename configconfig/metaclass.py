@@ -27,11 +27,16 @@ Metaclass for configuration values.
 #
 
 # stdlib
+import weakref
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Any, Callable, Dict, Mapping, Optional, Type, cast
+from textwrap import dedent, indent
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple, Type, Union, cast
+
+# 3rd party
+from typing_inspect import get_origin, is_literal_type  # type: ignore[import]
 
 # this package
-from configconfig.utils import basic_schema, get_json_type
+from configconfig.utils import _union_args, basic_schema, get_json_type, get_literal_values, tab
 
 __all__ = ["ConfigVarMeta"]
 
@@ -40,6 +45,44 @@ if TYPE_CHECKING:
 	from configconfig.configvar import ConfigVar
 
 
+_SCALAR_TYPES = frozenset({str, int, float, bool})
+_LIST_ORIGINS = frozenset({list, List})
+_DICT_ORIGINS = frozenset({dict, Dict})
+
+
+def _get_dtype_kind(dtype: Type) -> Optional[str]:
+	# Returns the suffix of the Validator.visit_* method used for ``dtype``,
+	# or None if there isn't one.
+
+	if dtype in _SCALAR_TYPES:
+		return dtype.__name__
+
+	origin = get_origin(dtype)
+
+	if origin in _LIST_ORIGINS:
+		return "list"
+	elif origin in _DICT_ORIGINS:
+		return "dict"
+	elif origin is Union:
+		return "union"
+	elif is_literal_type(dtype):
+		return "literal"
+	else:
+		return None
+
+
+def _first_paragraph(docstring: str) -> str:
+	# Returns the first paragraph of the docstring on a single line,
+	# or an empty string if the docstring is blank.
+
+	for paragraph in docstring.split("\n\n"):
+		paragraph = ' '.join([p.strip() for p in paragraph.split('\n') if p.strip()])
+		if paragraph:
+			return paragraph
+
+	return ''
+
+
 class ConfigVarMeta(type):
 	"""
 	Metaclass for configuration values.
@@ -47,32 +90,101 @@ class ConfigVarMeta(type):
 
 	dtype: Type
 	rtype: Type
+	_rtype_from_dtype: bool
+	_dtype_kind: Optional[str]
+	_dtype_origin: Any
+	_dtype_args: Tuple
+	_dtype_inner_origin: Any
+	_dtype_inner_is_literal: bool
+	_dtype_inner_args: Tuple
+	_literal_values: Tuple
+	_literal_set: FrozenSet
+	_list_element_types: Tuple[Type, ...]
 	required: bool
 	default: Any
 	validator: Callable
 	category: str
+	_doc_indented: str
+	_description: str
 	__name__: str
 
+	#: Mapping of fully qualified class names to :class:`~.ConfigVar` classes which have been created.
+	_registry: "weakref.WeakValueDictionary[str, ConfigVarMeta]" = weakref.WeakValueDictionary()
+
 	def __new__(cls, name: str, bases, dct: Dict):  # noqa: D102,MAN001
 		x = cast("ConfigVar", super().__new__(cls, name, bases, dct))
 
+		# The same class, for the private attributes which are only declared on ConfigVarMeta.
+		var = cast(ConfigVarMeta, x)
+
 		def get(name: str, default: Any) -> Any:
-			return dct.get(name, getattr(x, name, default))
+			# Only look up the inherited value if the class body doesn't set one.
+			if name in dct:
+				return dct[name]
+			return getattr(x, name, default)
 
 		x.dtype = get("dtype", Any)
+		var._dtype_kind = _get_dtype_kind(x.dtype)
+
+		# Cache the parts of dtype which are needed for validation and documentation.
+		var._dtype_origin = get_origin(x.dtype)
+		var._dtype_args = getattr(x.dtype, "__args__", ())
+		inner_type = var._dtype_args[0] if var._dtype_args else None
+		var._dtype_inner_origin = get_origin(inner_type)
+		var._dtype_inner_is_literal = is_literal_type(inner_type)
+		var._dtype_inner_args = getattr(inner_type, "__args__", ())
+
+		# The permitted values of a Literal dtype, or of the elements of a List of a Literal.
+		if var._dtype_kind == "literal":
+			var._literal_values = get_literal_values(x.dtype)
+		elif var._dtype_inner_is_literal:
+			var._literal_values = get_literal_values(inner_type)
+		else:
+			var._literal_values = ()
+
+		var._literal_set = frozenset(var._literal_values)
+
+		# The types permitted for the elements of a List which isn't a List of a Literal.
+		if var._dtype_kind != "list" or var._dtype_inner_is_literal:
+			var._list_element_types = ()
+		elif not var._dtype_args:
+			# A bare List, whose elements may be of any type.
+			var._list_element_types = (object, )
+		elif var._dtype_inner_origin is Union:
+			var._list_element_types = _union_args(inner_type)
+		else:
+			var._list_element_types = _union_args(x.dtype)
+
+		# An rtype of None means "use the dtype", which must be resolved against each subclass's own dtype.
+		rtype_from_dtype = "rtype" not in dct and getattr(x, "_rtype_from_dtype", False)
 
 		if "rtype" in dct:
 			x.rtype = dct["rtype"]
-		elif getattr(x, "rtype", Any) != Any:
+		elif getattr(x, "rtype", Any) != Any and not rtype_from_dtype:
 			pass
 		else:
 			x.rtype = x.dtype
 
+		if x.rtype is None:
+			x.rtype = x.dtype
+			rtype_from_dtype = True
+
+		var._rtype_from_dtype = rtype_from_dtype
+
 		x.required = get("required", False)
 		x.default = get("default", '')
 		x.validator = get("validator", lambda y: y)  # type: ignore[assignment]
 		x.category = get("category", "other")
-		x.__name__ = dct.get("name", dct.get("__name__", x.__name__))
+		var.__name__ = dct.get("name", dct.get("__name__", var.__name__))
+
+		var._description = _first_paragraph(var.__doc__ or '')
+
+		# The docstring, indented for use as the content of a ``.. conf::`` directive.
+		var._doc_indented = indent(dedent(var.__doc__ or ''), tab)
+		if not var._doc_indented.startswith('\n'):
+			var._doc_indented = '\n' + var._doc_indented
+
+		ConfigVarMeta._registry[f"{var.__module__}.{var.__qualname__}"] = var
 
 		return x
 
@@ -92,23 +204,25 @@ class ConfigVarMeta(type):
 					"required": [],
 					}
 
-		dtype = get_json_type(cls.dtype)
-		if dtype is NotImplemented:
-			raise NotImplementedError(cls.__name__, cls.dtype)
-		else:
-			schema["properties"][cls.__name__] = dtype
+		schema["properties"][cls.__name__] = cls._get_schema_property()
 
 		if cls.required:
 			schema["required"].append(cls.__name__)
 
-		for line in (cls.__doc__ or '').split("\n\n"):
-			line = ' '.join([p.strip() for p in line.split('\n') if p.strip()])
-			if line:
-				schema["properties"][cls.__name__]["description"] = line
-				break
-
 		return schema
 
+	def _get_schema_property(cls) -> Dict[str, Any]:
+		# Returns the entry for this configuration value in the "properties" of the JSON schema.
+
+		dtype = get_json_type(cls.dtype)
+		if dtype is NotImplemented:
+			raise NotImplementedError(cls.__name__, cls.dtype)
+
+		if cls._description:
+			dtype["description"] = cls._description
+
+		return dtype
+
 	@property
 	def schema_entry(cls) -> Dict[str, Any]:  # noqa: D102
 		return cls.get_schema_entry()
@@ -27,8 +27,10 @@ Configuration parser.
 #
 
 # stdlib
-import tempfile
-from typing import Any, List, Mapping, MutableMapping
+import copy
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Type
 
 # 3rd party
 from domdf_python_tools.paths import PathPlus
@@ -38,11 +40,79 @@ from ruamel.yaml import YAML
 # this package
 from configconfig.metaclass import ConfigVarMeta
 from configconfig.utils import make_schema
-from configconfig.validator import validate_files
 
 __all__ = ["Parser"]
 
 
+@functools.lru_cache(maxsize=32)
+def _load_yaml(content: bytes) -> Any:
+	# Keyed on the file's contents, so the file is parsed again whenever it changes.
+
+	# Uses the libyaml-based parser from ruamel.yaml.clib if it is available.
+	# The file is passed as bytes so the encoding is detected by the parser.
+	return YAML(typ="safe").load(content)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_schema_validator(
+		config_vars: Tuple[ConfigVarMeta, ...],
+		allow_unknown_keys: bool,
+		) -> Callable[[Any], None]:
+	# Returns a function which raises a jsonschema.ValidationError if the document is invalid.
+
+	# 3rd party
+	import jsonschema  # type: ignore[import]
+
+	schema = make_schema(*config_vars)
+	schema["additionalProperties"] = allow_unknown_keys
+
+	validator_cls = jsonschema.validators.validator_for(schema)
+	validator_cls.check_schema(schema)
+	validator = validator_cls(schema, format_checker=jsonschema.FormatChecker())
+
+	try:
+		# 3rd party
+		import fastjsonschema  # type: ignore[import]
+	except ImportError:
+		return validator.validate
+
+	try:
+		# The document is the cached parse of the file, so defaults from the schema must not be written into it.
+		fast_validate = fastjsonschema.compile(schema, use_default=False)
+	except fastjsonschema.JsonSchemaDefinitionException:
+		# A schema fastjsonschema can't handle.
+		return validator.validate
+
+	def validate(document: Any) -> None:
+		try:
+			fast_validate(document)
+		except fastjsonschema.JsonSchemaException:
+			# jsonschema has the final say, and gives more helpful errors.
+			validator.validate(document)
+
+	return validate
+
+
+@functools.lru_cache(maxsize=None)
+def _get_visitors(
+		parser_cls: Type["Parser"],
+		config_vars: Tuple[ConfigVarMeta, ...],
+		) -> Tuple[Tuple[str, ConfigVarMeta, Optional[str]], ...]:
+	# Returns the name, the ConfigVar and the name of the ``visit_<name>`` method (if any)
+	# for each configuration value.
+
+	visitors = []
+
+	for var in config_vars:
+		visitor_name: Optional[str] = f"visit_{var.__name__}"
+		if not hasattr(parser_cls, visitor_name):  # type: ignore[arg-type]
+			visitor_name = None
+
+		visitors.append((var.__name__, var, visitor_name))
+
+	return tuple(visitors)
+
+
 class Parser:
 	"""
 	Base class for YAML configuration parsers.
@@ -92,29 +162,63 @@ class Parser:
 		:param filename: The filename of the YAML configuration file.
 		"""
 
+		# 3rd party
+		import jsonschema  # type: ignore[import]
+
 		filename = PathPlus(filename)
 
 		if not filename.is_file():
 			raise FileNotFoundError(str(filename))
 
-		with tempfile.TemporaryDirectory() as tmpdir:
-			tmpdir_p = PathPlus(tmpdir)
-			schema_file = tmpdir_p / "schema.json"
-			schema = make_schema(*self.config_vars)
-			schema["additionalProperties"] = self.allow_unknown_keys
-			schema_file.dump_json(schema)
-			validate_files(schema_file, filename)
+		document = _load_yaml(filename.read_bytes())
+
+		try:
+			_get_schema_validator(tuple(self.config_vars), self.allow_unknown_keys)(document)
+		except jsonschema.exceptions.ValidationError as e:
+			e.filename = str(filename)
+			raise e
 
 		parsed_config_vars: MutableMapping[str, Any] = {}
 
-		with filename.open() as file:
-			raw_config_vars: Mapping[str, Any] = YAML(typ="safe", pure=True).load(file)
+		# The cached value is copied as custom parsing steps may modify it.
+		raw_config_vars: Mapping[str, Any] = copy.deepcopy(document)
+
+		visitors = _get_visitors(type(self), tuple(self.config_vars))  # type: ignore[arg-type]
 
-		for var in self.config_vars:
-			parsed_config_vars[var.__name__] = getattr(self, f"visit_{var.__name__}", var.get)(raw_config_vars)
+		for name, var, visitor_name in visitors:
+			if visitor_name is None:
+				# Visitors set on the instance, or provided by __getattr__, aren't found on the class.
+				visitor = getattr(self, f"visit_{name}", None)
+			else:
+				visitor = getattr(self, visitor_name)
+
+			if visitor is None:
+				parsed_config_vars[name] = var.get(raw_config_vars)
+			else:
+				parsed_config_vars[name] = visitor(raw_config_vars)
 
 		return self.custom_parsing(raw_config_vars, parsed_config_vars, filename)
 
+	def run_many(
+			self,
+			filenames: Iterable[PathLike],
+			max_workers: Optional[int] = None,
+			) -> List[MutableMapping[str, Any]]:
+		"""
+		Parse configuration from each of the given files, using a pool of threads.
+
+		.. versionadded:: 0.7.0
+
+		:param filenames: The filenames of the YAML configuration files.
+		:param max_workers: The maximum number of threads to use.
+			See :class:`concurrent.futures.ThreadPoolExecutor` for the default.
+
+		:returns: The parsed configuration for each file, in the same order as ``filenames``.
+		"""
+
+		with ThreadPoolExecutor(max_workers=max_workers) as executor:
+			return list(executor.map(self.run, filenames))
+
 	def custom_parsing(
 			self,
 			raw_config_vars: Mapping[str, Any],
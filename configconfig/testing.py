@@ -32,8 +32,7 @@ Helpers for testing :class:`~configconfig.configvar.ConfigVar`.
 #
 
 # stdlib
-from abc import ABC
-from typing import Any, Dict, List, Type
+from typing import Any, Dict, List, Set, Type
 
 # 3rd party
 import pytest  # nodep
@@ -62,14 +61,59 @@ test_list_int = [1, 2, 3, 4]
 test_list_str = ['a', 'b', 'c', 'd']
 
 
-class ConfigVarTest(ABC):
+class ConfigVarTest:
 	r"""
 	Base class for tests of :class:`~configconfig.configvar.ConfigVar`\s.
+
+	.. versionchanged:: 0.7.0
+
+		``test_true``, ``test_false``, ``test_errors`` and ``test_non_enum`` now take a single value
+		(``true_value``, ``false_value``, ``wrong_value`` or ``non_enum``), which is parametrized by
+		:meth:`~.ConfigVarTest.pytest_generate_tests`, rather than looping over all of the values.
+		Subclasses which override these methods and call ``super()`` must pass the value on.
 	"""
 
 	#: The :class:`~configconfig.configvar.ConfigVar` under test.
 	config_var: Type[ConfigVar]
 
+	def pytest_generate_tests(self, metafunc: "pytest.Metafunc") -> None:
+		"""
+		Parametrize test methods which take one of the following arguments with values from the test class.
+
+		* ``true_value`` -- from ``true_values``
+		* ``false_value`` -- from ``false_values``
+		* ``wrong_value`` -- from ``wrong_values``
+		* ``non_enum`` -- from ``non_enum_values``
+
+		Arguments which are already parametrized with :func:`pytest.mark.parametrize` are left alone.
+
+		.. versionadded:: 0.7.0
+
+		:param metafunc:
+		"""
+
+		parametrized: Set[str] = set()
+
+		for marker in metafunc.definition.iter_markers("parametrize"):
+			argnames = marker.args[0] if marker.args else marker.kwargs["argnames"]
+			if isinstance(argnames, str):
+				argnames = argnames.split(',')
+			parametrized.update(name.strip() for name in argnames)
+
+		for argname, attribute in _parametrized_arguments:
+			if argname in metafunc.fixturenames and argname not in parametrized:
+				metafunc.parametrize(argname, getattr(self, attribute))
+
+
+# The test method arguments which are parametrized by ConfigVarTest.pytest_generate_tests,
+# and the attributes of the test class which contain their values.
+_parametrized_arguments = (
+		("true_value", "true_values"),
+		("false_value", "false_values"),
+		("wrong_value", "wrong_values"),
+		("non_enum", "non_enum_values"),
+		)
+
 
 class NotIntTest(ConfigVarTest):
 	r"""
@@ -238,13 +282,11 @@ class BoolTrueTest(ConfigVarTest):
 	def test_empty_get(self):  # noqa: D102
 		assert self.config_var.get()
 
-	def test_true(self):  # noqa: D102
-		for true_value in self.true_values:
-			assert self.config_var.get(true_value)
+	def test_true(self, true_value: Dict[str, Any]):  # noqa: D102
+		assert self.config_var.get(true_value)
 
-	def test_false(self):  # noqa: D102
-		for false_value in self.false_values:
-			assert not self.config_var.get(false_value)
+	def test_false(self, false_value: Dict[str, Any]):  # noqa: D102
+		assert not self.config_var.get(false_value)
 
 	@property
 	def wrong_values(self) -> List[Dict[str, Any]]:
@@ -258,10 +300,9 @@ class BoolTrueTest(ConfigVarTest):
 				{self.config_var.__name__: test_list_str},
 				]
 
-	def test_errors(self):  # noqa: D102
-		for wrong_value in self.wrong_values:
-			with pytest.raises(ValueError):  # noqa: PT011
-				self.config_var.get(wrong_value)
+	def test_errors(self, wrong_value: Dict[str, Any]):  # noqa: D102
+		with pytest.raises(ValueError):  # noqa: PT011
+			self.config_var.get(wrong_value)
 
 
 class BoolFalseTest(BoolTrueTest):
@@ -327,10 +368,9 @@ class RequiredStringTest(ConfigVarTest):
 				{self.config_var.__name__: test_list_str},
 				]
 
-	def test_errors(self):  # noqa: D102
-		for wrong_value in self.wrong_values:
-			with pytest.raises(ValueError):  # noqa: PT011
-				self.config_var.get(wrong_value)
+	def test_errors(self, wrong_value: Dict[str, Any]):  # noqa: D102
+		with pytest.raises(ValueError):  # noqa: PT011
+			self.config_var.get(wrong_value)
 
 
 class OptionalStringTest(RequiredStringTest):
@@ -365,10 +405,9 @@ class OptionalStringTest(RequiredStringTest):
 				{self.config_var.__name__: test_list_str},
 				]
 
-	def test_errors(self):  # noqa: D102
-		for wrong_value in self.wrong_values:
-			with pytest.raises(ValueError):  # noqa: PT011
-				self.config_var.get(wrong_value)
+	def test_errors(self, wrong_value: Dict[str, Any]):  # noqa: D102
+		with pytest.raises(ValueError):  # noqa: PT011
+			self.config_var.get(wrong_value)
 
 
 class EnumTest(RequiredStringTest):
@@ -386,21 +425,9 @@ class EnumTest(RequiredStringTest):
 		assert self.config_var.get() == self.default_value
 		assert self.config_var.get({}) == self.default_value
 
-	def test_non_enum(self):  # noqa: D102
-		for non_enum in self.non_enum_values:
-			with pytest.raises(ValueError):  # noqa: PT011
-				self.config_var.get({self.config_var.__name__: non_enum})
-
-	def test_errors(self):  # noqa: D102
-		wrong_values: List[Dict[str, Any]] = [
-				{self.config_var.__name__: 1234},
-				{self.config_var.__name__: True},
-				{self.config_var.__name__: test_list_int},
-				{self.config_var.__name__: test_list_str},
-				]
-		for wrong_value in wrong_values:
-			with pytest.raises(ValueError):  # noqa: PT011
-				self.config_var.get(wrong_value)
+	def test_non_enum(self, non_enum: Any):  # noqa: D102
+		with pytest.raises(ValueError):  # noqa: PT011
+			self.config_var.get({self.config_var.__name__: non_enum})
 
 
 class DictTest(NotStrTest, NotBoolTest, NotIntTest, ConfigVarTest):
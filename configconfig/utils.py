@@ -35,6 +35,7 @@ Utility functions.
 
 # stdlib
 import copy
+import functools
 import sys
 import typing
 from enum import EnumMeta
@@ -75,12 +76,12 @@ else:  # pragma: no cover (>=py38)
 			get_args(Union[int, Tuple[T, int]][str]) == (int, Tuple[str, int])
 			get_args(Callable[[], T][int]) == ([], int)
 		"""
-		if hasattr(tp, "__args__"):
-			res = tp.__args__
-			if get_origin(tp) is collections.abc.Callable and res[0] is not Ellipsis:
-				res = (list(res[:-1]), res[-1])
-			return res
-		return ()
+		res = getattr(tp, "__args__", None)
+		if res is None:
+			return ()
+		if get_origin(tp) is collections.abc.Callable and res[0] is not Ellipsis:
+			res = (list(res[:-1]), res[-1])
+		return res
 
 
 __all__ = [
@@ -106,6 +107,10 @@ GenericAliasType = Any
 # 	GenericAliasType = type(List)
 
 
+# Sentinel for values missing from the raw configuration.
+_MISSING = object()
+
+
 def optional_getter(raw_config_vars: Dict[str, Any], cls: "ConfigVarMeta", required: bool) -> Any:
 	"""
 	Returns either the configuration value, the default,
@@ -116,20 +121,41 @@ def optional_getter(raw_config_vars: Dict[str, Any], cls: "ConfigVarMeta", requi
 	:param required:
 	"""  # noqa: D400
 
-	if required:
-		try:
-			return raw_config_vars[cls.__name__]
-		except KeyError:
-			raise ValueError(f"A value for '{cls.__name__}' is required.") from None
+	name = cls.__name__
+	value = raw_config_vars.get(name, _MISSING)
+
+	if value is not _MISSING:
+		return value
+	elif required:
+		raise ValueError(f"A value for '{name}' is required.") from None
+
+	default = cls.default
+
+	if callable(default):
+		return _copy_default(default(raw_config_vars))
 	else:
+		return _copy_default(default)
+
+
+# Types which are immutable and do not contain other objects.
+_atomic_types = frozenset({str, int, float, bool, bytes, type(None)})
 
-		if cls.__name__ in raw_config_vars:
-			return raw_config_vars[cls.__name__]
-		else:
-			if isinstance(cls.default, Callable):  # type: ignore[arg-type]
-				return copy.deepcopy(cls.default(raw_config_vars))
-			else:
-				return copy.deepcopy(cls.default)
+
+def _copy_default(default: Any) -> Any:
+	# Returns a copy of the default value, avoiding copy.deepcopy for the common simple cases.
+
+	default_type = type(default)
+
+	if default_type in _atomic_types:
+		return default
+	elif default_type is list:
+		if all(type(x) in _atomic_types for x in default):
+			return default.copy()
+	elif default_type is dict:
+		if all(type(k) in _atomic_types and type(v) in _atomic_types for k, v in default.items()):
+			return default.copy()
+
+	return copy.deepcopy(default)
 
 
 #: Mapping of Python types to their YAML equivalents.
@@ -148,47 +174,87 @@ def check_type(left: Type, *right: Type) -> bool:
 	return left in right or get_origin(left) in right
 
 
+def _yaml_union(type_: Type) -> str:
+	return " or ".join([yaml_type_lookup[x] for x in type_.__args__])
+
+
+def _yaml_list(type_: Type) -> str:
+	args = get_args(type_)
+
+	inner_types: typing.List[str]
+
+	if args:
+		inner_types = [get_yaml_type(x) for x in args if not isinstance(x, TypeVar)]
+	else:
+		inner_types = []
+
+	dtype = " or ".join(inner_types)
+	if dtype:
+		return f"Sequence of {dtype}"
+	else:
+		return "Sequence"
+
+
+def _yaml_dict(type_: Type) -> str:
+	args = get_args(type_)
+	if not args or any(isinstance(t, TypeVar) for t in args):
+		return "Mapping"
+	else:
+		dtype = " to ".join([get_yaml_type(x) for x in args])
+		return f"Mapping of {dtype}"
+
+
+# Functions to get the YAML type for generic types, keyed by the type's origin.
+_yaml_type_handlers: Dict[Any, Callable[[Type], str]] = {
+		Union: _yaml_union,
+		list: _yaml_list,
+		List: _yaml_list,
+		dict: _yaml_dict,
+		Dict: _yaml_dict,
+		}
+
+
+def _type_key(type_: Any) -> typing.Tuple:
+	# Returns the key to cache the YAML and JSON types of type_ under.
+	# typing considers e.g. Union[int, float] and Union[float, int] to be equal, with the same hash,
+	# so the arguments (and their types, as 1 == True) are part of the key to keep their declared order.
+
+	if sys.version_info < (3, 7) and is_literal_type(type_):  # pragma: no cover (>=py37)
+		args = getattr(type_, "__values__", None) or ()
+	else:
+		args = get_args(type_)
+
+	return (type_, tuple((_type_key(arg), type(arg)) for arg in args))
+
+
 def get_yaml_type(type_: Type) -> str:
 	r"""
 	Get the YAML type that corresponds to the given Python type.
 
+	The result is cached for each type.
+
 	:param type\_:
 	"""
 
-	if type_ in yaml_type_lookup:
-		return yaml_type_lookup[type_]
+	return _cached_yaml_type(_type_key(type_))
 
-	elif get_origin(type_) is Union:
-		dtype = " or ".join(yaml_type_lookup[x] for x in type_.__args__)
-		return dtype
 
-	elif check_type(type_, list, List):
-		args = get_args(type_)
+@functools.lru_cache(maxsize=None)
+def _cached_yaml_type(key: typing.Tuple) -> str:
+	type_: Type = key[0]
+	yaml_type = yaml_type_lookup.get(type_)
 
-		inner_types: typing.Iterable[str]
+	if yaml_type is not None:
+		return yaml_type
 
-		if args:
-			inner_types = (get_yaml_type(x) for x in args if not isinstance(x, TypeVar))
-		else:
-			inner_types = ()
+	handler = _yaml_type_handlers.get(get_origin(type_))
 
-		dtype = " or ".join(inner_types)
-		if dtype:
-			return f"Sequence of {dtype}"
-		else:
-			return "Sequence"
-
-	elif check_type(type_, dict, Dict):
-		args = get_args(type_)
-		if not args or any(isinstance(t, TypeVar) for t in args):
-			return "Mapping"
-		else:
-			dtype = " to ".join(get_yaml_type(x) for x in get_args(type_))
-			return f"Mapping of {dtype}"
+	if handler is not None:
+		return handler(type_)
 
 	elif is_literal_type(type_):
-		types = [y for y in get_literal_values(type_)]
-		return " or ".join(repr(x) for x in types)
+		types = get_literal_values(type_)
+		return " or ".join([repr(x) for x in types])
 
 	elif isinstance(type_, EnumMeta):
 		return " or ".join([repr(x._value_) for x in type_])
@@ -219,6 +285,7 @@ def make_schema(*configuration_variables: "ConfigVarMeta") -> Dict[str, Any]:
 			"additionalProperties": False,
 			}
 
+	# Each ConfigVar adds its own entry, so subclasses may override get_schema_entry.
 	for var in configuration_variables:
 		schema = var.get_schema_entry(schema)
 
@@ -234,12 +301,19 @@ def check_union(obj: Any, dtype: Union["GenericAliasType", "UnionType"]) -> bool
 	:type dtype: :py:obj:`~typing.Union`\, :class:`~typing.List`\, etc.
 	"""
 
+	return isinstance(obj, _union_args(dtype))
+
+
+def _union_args(dtype: Union["GenericAliasType", "UnionType"]) -> typing.Tuple[Type, ...]:
+	# Returns the types to pass to isinstance for check_union.
+	# Integers are accepted where floats are.
+
 	args = dtype.__args__
 
 	if float in args and int not in args:
-		args = (*dtype.__args__, int)
+		args = args + (int, )
 
-	return isinstance(obj, args)
+	return args
 
 
 def get_json_type(type_: Type) -> Dict[str, Union[str, List, Dict]]:
@@ -249,34 +323,71 @@ def get_json_type(type_: Type) -> Dict[str, Union[str, List, Dict]]:
 	:param type\_:
 	"""
 
-	if type_ in json_type_lookup:
-		return {"type": json_type_lookup[type_]}
+	json_type = _get_json_type(type_)
 
-	elif get_origin(type_) is Union:
-		return {"type": [get_json_type(t)["type"] for t in type_.__args__]}
+	if json_type is NotImplemented:
+		return json_type
+
+	# The cached value must not be modified by the caller.
+	return copy.deepcopy(json_type)
+
+
+def _json_union(type_: Type) -> Dict[str, Union[str, List, Dict]]:
+	return {"type": [_get_json_type(t)["type"] for t in type_.__args__]}
+
+
+def _json_list(type_: Type) -> Dict[str, Union[str, List, Dict]]:
+	args = get_args(type_)
+
+	if args:
+		items = _get_json_type(args[0])
+
+		if items is NotImplemented:
+			return {"type": "array"}
+		elif "type" in items:
+			return {"type": "array", "items": items}
+		elif "enum" in items:
+			return {"type": "array", "items": items}
+		else:
+			return {"type": "array"}
+
+	return {"type": "array"}
+
+
+def _json_dict(type_: Type) -> Dict[str, Union[str, List, Dict]]:
+	return {"type": "object"}
+
+
+# Functions to get the JSON schema type for generic types, keyed by the type's origin.
+_json_type_handlers: Dict[Any, Callable[[Type], Dict[str, Union[str, List, Dict]]]] = {
+		Union: _json_union,
+		list: _json_list,
+		List: _json_list,
+		dict: _json_dict,
+		Dict: _json_dict,
+		}
+
+
+def _get_json_type(type_: Type) -> Dict[str, Union[str, List, Dict]]:
+	# The returned value is cached, and must not be modified.
+	return _cached_json_type(_type_key(type_))
 
-	elif check_type(type_, list, List):
-		args = get_args(type_)
 
-		if args:
-			items = get_json_type(args[0])
+@functools.lru_cache(maxsize=None)
+def _cached_json_type(key: typing.Tuple) -> Dict[str, Union[str, List, Dict]]:
+	type_: Type = key[0]
+	json_type = json_type_lookup.get(type_)
 
-			if items is NotImplemented:
-				return {"type": "array"}
-			elif "type" in items:
-				return {"type": "array", "items": items}
-			elif "enum" in items:
-				return {"type": "array", "items": items}
-			else:
-				return {"type": "array"}
+	if json_type is not None:
+		return {"type": json_type}
 
-		return {"type": "array"}
+	handler = _json_type_handlers.get(get_origin(type_))
 
-	elif check_type(type_, dict, Dict):
-		return {"type": "object"}
+	if handler is not None:
+		return handler(type_)
 
 	elif check_type(type_, Literal) or is_literal_type(type_):  # type: ignore[arg-type]
-		return {"enum": [x for x in get_literal_values(type_)]}
+		return {"enum": list(get_literal_values(type_))}
 
 	elif isinstance(type_, EnumMeta):
 		return {"enum": [x._value_ for x in type_]}
@@ -32,22 +32,38 @@ Validate values obtained from the ``YAML`` file and coerce into the appropriate
 
 # stdlib
 import pathlib
-from typing import Any, Dict, Iterable, List, Optional, Union
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Union
 
 # 3rd party
-import jsonschema  # type: ignore[import]
 from domdf_python_tools.typing import PathLike
 from domdf_python_tools.utils import strtobool
-from ruamel.yaml import YAML
 from typing_extensions import NoReturn
-from typing_inspect import get_origin, is_literal_type  # type: ignore[import]
 
 # this package
 from configconfig.metaclass import ConfigVarMeta
-from configconfig.utils import RawConfigVarsType, check_union, get_literal_values, optional_getter
+from configconfig.utils import RawConfigVarsType, check_union, optional_getter
 
 __all__ = ["Validator", "validate_files"]
 
+# Mapping of the supported Dict dtypes to the kind of conversion performed by visit_dict.
+_DICT_KINDS = {
+		Dict[str, str]: "str_str",
+		Dict[str, Any]: "str_any",
+		Dict[str, List[str]]: "str_list_str",
+		}
+
+_CONVERTIBLE_TYPES = frozenset({int, str, float, bool})
+
+
+def _is_literal_value(obj: Any, literal_set: FrozenSet) -> bool:
+	# Returns whether obj is one of the values in literal_set.
+	# Unhashable objects (e.g. lists in the YAML file) can never be Literal values.
+
+	try:
+		return obj in literal_set
+	except TypeError:
+		return False
+
 
 class Validator:
 	"""
@@ -56,16 +72,22 @@ class Validator:
 	.. autosummary-widths:: 4/10
 	"""
 
+	# Mapping of ConfigVarMeta._dtype_kind to the name of the visitor method.
+	# Names rather than functions are stored so subclasses may override the visitors.
+	_visitors: Dict[str, str] = {
+			"str": "visit_str",
+			"int": "visit_int",
+			"float": "visit_float",
+			"bool": "visit_bool",
+			"list": "visit_list",
+			"dict": "visit_dict",
+			"union": "visit_union",
+			"literal": "visit_literal",
+			}
+
 	def __init__(self, config_var: ConfigVarMeta):
 		self.config_var = config_var
 
-	_dtypes = {
-			str: "str",
-			int: "int",
-			float: "float",
-			bool: "bool",
-			}
-
 	def validate(self, raw_config_vars: Optional[RawConfigVarsType] = None) -> Any:
 		"""
 		Validate the configuration value.
@@ -76,29 +98,16 @@ class Validator:
 		"""
 
 		if raw_config_vars is None:
+			# A new dict, as it is passed on to callable defaults which may modify it.
 			raw_config_vars = {}
 
-		if self.config_var.rtype is None:
-			self.config_var.rtype = self.config_var.dtype
-
-		if self.config_var.dtype in self._dtypes:
-			return getattr(self, f"visit_{self._dtypes[self.config_var.dtype]}")(raw_config_vars)
+		visitor_name = self._visitors.get(self.config_var._dtype_kind)  # type: ignore[arg-type]
 
-		elif get_origin(self.config_var.dtype) in {list, List}:
-			return self.visit_list(raw_config_vars)
-
-		elif get_origin(self.config_var.dtype) in {dict, Dict}:
-			return self.visit_dict(raw_config_vars)
-
-		elif get_origin(self.config_var.dtype) is Union:
-			return self.visit_union(raw_config_vars)
-
-		elif is_literal_type(self.config_var.dtype):
-			return self.visit_literal(raw_config_vars)
-
-		else:
+		if visitor_name is None:
 			self.unknown_type()
 
+		return getattr(self, visitor_name)(raw_config_vars)
+
 	def _visit_str_number(self, raw_config_vars: RawConfigVarsType) -> Union[str, int, float]:
 		obj = optional_getter(raw_config_vars, self.config_var, self.config_var.required)
 
@@ -161,49 +170,51 @@ class Validator:
 		# Lists of strings, numbers, Unions and Literals
 		buf = []
 
-		data = optional_getter(raw_config_vars, self.config_var, self.config_var.required)
-		if isinstance(data, str) or not isinstance(data, Iterable):
-			raise ValueError(
-					f"'{self.config_var.__name__}' must be a List of {self.config_var.dtype.__args__[0]}"
-					) from None
-
-		if get_origin(self.config_var.dtype.__args__[0]) is Union:
-			for obj in data:
-				if not check_union(obj, self.config_var.dtype.__args__[0]):
-					raise ValueError(
-							f"'{self.config_var.__name__}' must be a "
-							f"List of {self.config_var.dtype.__args__[0]}"
-							) from None
+		config_var = self.config_var
+		name = config_var.__name__
+		inner_type = config_var._dtype_args[0] if config_var._dtype_args else Any
+		inner_is_literal = config_var._dtype_inner_is_literal
+
+		data = optional_getter(raw_config_vars, config_var, config_var.required)
+		if isinstance(data, (list, tuple)):
+			# The usual case, which avoids the slower check against the Iterable ABC.
+			pass
+		elif isinstance(data, str) or not isinstance(data, Iterable):
+			raise ValueError(f"'{name}' must be a List of {inner_type}") from None
+
+		# These are computed once per ConfigVar by ConfigVarMeta.
+		allowed_types = config_var._list_element_types
+		literal_values = config_var._literal_values
+		literal_set = config_var._literal_set
+
+		# Values are converted to the rtype's argument if it is one of these types.
+		rtype_args = getattr(config_var.rtype, "__args__", ())
+		if rtype_args and rtype_args[0] in _CONVERTIBLE_TYPES:
+			converter = rtype_args[0]
+		else:
+			converter = None
 
-		elif is_literal_type(self.config_var.dtype.__args__[0]):
-			for obj in data:
+		# Validate and convert each element in a single pass.
+		for obj in data:
+			if inner_is_literal:
 				# if isinstance(obj, str):
 				# 	obj = obj.lower()
-				if obj not in get_literal_values(self.config_var.dtype.__args__[0]):
-					raise ValueError(
-							f"Elements of '{self.config_var.__name__}' must be "
-							f"one of {get_literal_values(self.config_var.dtype.__args__[0])}"
-							) from None
-		else:
-			for obj in data:
-				if not check_union(obj, self.config_var.dtype):
-					raise ValueError(
-							f"'{self.config_var.__name__}' must be a List of {self.config_var.dtype.__args__[0]}"
-							) from None
+				if not _is_literal_value(obj, literal_set):
+					raise ValueError(f"Elements of '{name}' must be one of {literal_values}") from None
 
-		try:
-			for obj in data:
-				if self.config_var.rtype.__args__[0] in {int, str, float, bool}:
-					buf.append(self.config_var.rtype.__args__[0](obj))
-				else:
-					buf.append(obj)
+			# Unions and plain types are both checked against allowed_types.
+			elif not isinstance(obj, allowed_types):
+				raise ValueError(f"'{name}' must be a List of {inner_type}") from None
 
-			return buf
+			if converter is None:
+				buf.append(obj)
+			else:
+				try:
+					buf.append(converter(obj))
+				except ValueError:
+					raise ValueError(f"Values in '{name}' must be {converter}") from None
 
-		except ValueError:
-			raise ValueError(
-					f"Values in '{self.config_var.__name__}' must be {self.config_var.rtype.__args__[0]}"
-					) from None
+		return buf
 
 	def visit_dict(self, raw_config_vars: RawConfigVarsType) -> Dict:
 		"""
@@ -212,32 +223,26 @@ class Validator:
 		:param raw_config_vars:
 		"""
 
-		# Dict[str, str]
-		if self.config_var.dtype == Dict[str, str]:
-			obj = optional_getter(raw_config_vars, self.config_var, self.config_var.required)
-			if not isinstance(obj, dict):
-				raise ValueError(f"'{self.config_var.__name__}' must be a dictionary") from None
-
-			return {str(k): str(v) for k, v in obj.items()}
+		dict_kind = _DICT_KINDS.get(self.config_var.dtype)
 
-		# Dict[str, Any]
-		elif self.config_var.dtype == Dict[str, Any]:
-			obj = optional_getter(raw_config_vars, self.config_var, self.config_var.required)
-			if not isinstance(obj, dict):
-				raise ValueError(f"'{self.config_var.__name__}' must be a dictionary") from None
+		if dict_kind is None:
+			self.unknown_type()
 
-			return obj
+		obj = optional_getter(raw_config_vars, self.config_var, self.config_var.required)
+		if not isinstance(obj, dict):
+			raise ValueError(f"'{self.config_var.__name__}' must be a dictionary") from None
 
-		# Dict[str, List[str]
-		elif self.config_var.dtype == Dict[str, List[str]]:
-			obj = optional_getter(raw_config_vars, self.config_var, self.config_var.required)
-			if not isinstance(obj, dict):
-				raise ValueError(f"'{self.config_var.__name__}' must be a dictionary") from None
+		# Dict[str, str]
+		if dict_kind == "str_str":
+			return {str(k): str(v) for k, v in obj.items()}
 
+		# Dict[str, List[str]]
+		elif dict_kind == "str_list_str":
 			return {str(k): [str(i) for i in v] for k, v in obj.items()}
 
+		# Dict[str, Any]
 		else:
-			self.unknown_type()
+			return obj
 
 	def visit_union(self, raw_config_vars: RawConfigVarsType) -> Any:
 		"""
@@ -271,9 +276,9 @@ class Validator:
 		obj = optional_getter(raw_config_vars, self.config_var, self.config_var.required)
 		# if isinstance(obj, str):
 		# 	obj = obj.lower()
-		if obj not in get_literal_values(self.config_var.dtype):
+		if not _is_literal_value(obj, self.config_var._literal_set):
 			raise ValueError(
-					f"'{self.config_var.__name__}' must be one of {get_literal_values(self.config_var.dtype)}"
+					f"'{self.config_var.__name__}' must be one of {self.config_var._literal_values}"
 					) from None
 
 		return obj
@@ -283,10 +288,10 @@ class Validator:
 		Called when the desired type has no visitor.
 		"""
 
-		print(self.config_var)
-		print(self.config_var.dtype)
-		print(get_origin(self.config_var.dtype))
-		raise NotImplementedError
+		raise NotImplementedError(
+				f"No visitor for {self.config_var!r} with dtype {self.config_var.dtype!r} "
+				f"(origin {self.config_var._dtype_origin!r})"
+				)
 
 
 def validate_files(
@@ -304,15 +309,26 @@ def validate_files(
 	.. versionadded:: 0.4.0
 	"""
 
+	# 3rd party
+	import jsonschema  # type: ignore[import]
+	from ruamel.yaml import YAML
+
 	schemafile = pathlib.Path(schemafile)
 
-	yaml = YAML(typ="safe", pure=True)
+	yaml = YAML(typ="safe")
 	schema = yaml.load(schemafile.read_text(encoding=encoding))
 
+	# Check and compile the schema once, rather than for every document.
+	validator_cls = jsonschema.validators.validator_for(schema)
+	validator_cls.check_schema(schema)
+	validator = validator_cls(schema, format_checker=jsonschema.FormatChecker())
+
 	for filename in datafiles:
-		for document in yaml.load_all(pathlib.Path(filename).read_text(encoding=encoding)):
-			try:
-				jsonschema.validate(document, schema, format_checker=jsonschema.FormatChecker())
-			except jsonschema.exceptions.ValidationError as e:
-				e.filename = str(filename)
-				raise e
+		# The documents are parsed from the open file as they are needed.
+		with pathlib.Path(filename).open(encoding=encoding) as fp:
+			for document in yaml.load_all(fp):
+				try:
+					validator.validate(document)
+				except jsonschema.exceptions.ValidationError as e:
+					e.filename = str(filename)
+					raise e
@@ -1,10 +1,11 @@
 # stdlib
-from typing import Type
+from typing import List, Tuple, Type
 
 # 3rd party
 import pytest
 
 # this package
+from configconfig.configvar import ConfigVar
 from configconfig.testing import (
 		BoolFalseTest,
 		BoolTrueTest,
@@ -427,7 +428,7 @@ class Test_travis_site(EnumTest):
 	config_var = travis_site
 	test_value = "org"
 	default_value = "com"
-	non_enum_values = ["net", "a string"]
+	non_enum_values = ["net", "a string", ["com"]]
 
 
 class Test_travis_ubuntu_version(EnumTest):
@@ -447,6 +448,7 @@ class Test_platforms:
 			["win32"],
 			["posix"],
 			["a string"],
+			[["Windows"]],
 			]
 
 	def test_empty_get(self):
@@ -498,13 +500,10 @@ class Test_python_deploy_version(OptionalStringTest):
 	config_var = python_deploy_version
 	test_value = "3.8"
 	default_value = "3.6"
-
-	@property
-	def wrong_values(self) -> List[Dict[str, Any]]:  # noqa: D102
-		return [
-				{self.config_var.__name__: test_list_int},
-				{self.config_var.__name__: test_list_str},
-				]
+	wrong_values = [
+			{python_deploy_version.__name__: test_list_int},
+			{python_deploy_version.__name__: test_list_str},
+			]
 
 	def test_success(self):
 		assert self.config_var.get({self.config_var.__name__: 3.8}) == "3.8"
@@ -557,3 +556,58 @@ def test_subclassing():
 	assert subclassed.rtype == List[str]
 	assert subclassed.default == default_python_versions
 	assert subclassed.category == "python versions"
+
+
+def test_subclassing_rtype_none():
+
+	class parent(ConfigVar):
+		dtype = List[str]
+		rtype = None  # type: ignore[assignment]
+		required = True
+
+	class child(parent):
+		dtype = List[int]
+
+	class grandchild(child):
+		pass
+
+	assert parent.get({"parent": ['1', '2']}) == ['1', '2']
+	assert child.rtype == List[int]
+	assert child.get({"child": [1, 2]}) == [1, 2]
+	assert grandchild.get({"grandchild": [1, 2]}) == [1, 2]
+
+
+def test_unknown_type():
+
+	class coordinates(ConfigVar):
+		dtype = Tuple[int, int]
+
+	with pytest.raises(NotImplementedError, match=r"No visitor for <ConfigVar 'coordinates'> with dtype"):
+		coordinates.get({"coordinates": (1, 2)})
+
+
+def test_callable_default_mutates_raw_config_vars():
+
+	def default_tags(raw_config_vars: Dict[str, Any]) -> List[str]:
+		raw_config_vars.setdefault("tags", ["default"])
+		assert isinstance(raw_config_vars, dict)
+		return raw_config_vars["tags"]
+
+	class tags(ConfigVar):
+		dtype = List[str]
+		default = default_tags
+
+	assert tags.get() == ["default"]
+	assert tags.get({}) == ["default"]
+
+
+def test_bare_list():
+
+	class anything(ConfigVar):
+		dtype = List
+		required = True
+
+	assert anything.get({"anything": ["a", 1, 2.5, None]}) == ["a", 1, 2.5, None]
+
+	with pytest.raises(ValueError, match=r"'anything' must be a List of typing\.Any"):
+		anything.get({"anything": "abc"})
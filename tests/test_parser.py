@@ -1,13 +1,19 @@
 # stdlib
+import os
 import pathlib
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Tuple
+import sys
+from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Set, Tuple
 
 # 3rd party
+import jsonschema  # type: ignore[import]
+import pytest
 from domdf_python_tools.paths import PathPlus
 from pytest_regressions.data_regression import DataRegressionFixture
 
 # this package
-from configconfig.parser import Parser
+from configconfig.configvar import ConfigVar
+from configconfig.metaclass import ConfigVarMeta
+from configconfig.parser import Parser, _get_schema_validator
 from tests.configuration import (
 		additional_setup_args,
 		author,
@@ -56,6 +62,9 @@ from tests.configuration import (
 		)
 
 
+config_file = PathPlus(__file__).parent / "config_file.yml"
+
+
 class DemoParser(Parser):
 
 	config_vars = [
@@ -145,26 +154,26 @@ def parse_extras(raw_config_vars: Mapping[str, Any], repo_path: pathlib.Path) ->
 
 	extras_require = raw_config_vars.get("extras_require", {})
 
-	all_extras = []
+	if not extras_require:
+		return {"all": []}, additional_requirements_files
+
+	all_extras: Set[str] = set()
 
 	for extra, requires in extras_require.items():
 		if isinstance(requires, str):
 			if (repo_path / requires).is_file():
 				# a path to the requirements file from the repo root
-				extras_require[extra] = [
-						x for x in (repo_path / requires).read_text(encoding="UTF-8").split('\n') if x
-						]
+				requirements = (repo_path / requires).read_text(encoding="UTF-8").splitlines()
+				extras_require[extra] = list(filter(None, requirements))
 				if requires not in additional_requirements_files:
 					additional_requirements_files.append(requires)
 			else:
 				# A single requirement
 				extras_require[extra] = [requires]
 
-		all_extras += [x.replace(' ', '') for x in extras_require[extra]]
+		all_extras.update(x.replace(' ', '') for x in extras_require[extra])
 
-	all_extras = sorted(set(all_extras))
-
-	extras_require["all"] = all_extras
+	extras_require["all"] = sorted(all_extras)
 
 	return extras_require, additional_requirements_files
 
@@ -226,7 +235,198 @@ def get_gh_actions_python_versions(
 	return tox_travis_matrix
 
 
-def test_parser(data_regression: DataRegressionFixture):
+@pytest.fixture(scope="module")
+def parsed_config() -> MutableMapping[str, Any]:
+	# Shared by the tests which only read the parsed configuration.
+	return DemoParser().run(config_file)
+
+
+def test_parser(parsed_config: MutableMapping[str, Any], data_regression: DataRegressionFixture):
+	data_regression.check(parsed_config)
+
+
+class MutatingParser(DemoParser):
+
+	def custom_parsing(
+			self,
+			raw_config_vars: Mapping[str, Any],
+			parsed_config_vars: MutableMapping[str, Any],
+			filename: PathPlus,
+			) -> MutableMapping[str, Any]:
+		raw_config_vars["python_versions"].append("4.0")
+		parsed_config_vars["raw_python_versions"] = raw_config_vars["python_versions"]
+		return super().custom_parsing(raw_config_vars, parsed_config_vars, filename)
+
+
+def test_parser_repeated(tmp_pathplus: PathPlus):
+	filename = tmp_pathplus / "config_file.yml"
+	filename.write_text(config_file.read_text())
+
+	parser = MutatingParser()
+	first = parser.run(filename)
+	assert first["raw_python_versions"] == [3.7, 3.8, "3.9-dev", "4.0"]
+	assert parser.run(filename) == first
+
+	filename.write_lines([*filename.read_lines(), "keywords:", "  - changed"])
+	assert parser.run(filename)["keywords"] == ["changed"]
+
+	# An edit which keeps the same size and modification time.
+	stat = filename.stat()
+	filename.write_text(filename.read_text().replace("changed", "altered"))
+	os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+	assert parser.run(filename)["keywords"] == ["altered"]
+
+
+def test_parser_invalid(tmp_pathplus: PathPlus):
+	filename = tmp_pathplus / "config_file.yml"
+	filename.write_lines(["modname: 1234"])
+
+	with pytest.raises(jsonschema.ValidationError, match="1234 is not of type 'string'") as e:
+		DemoParser().run(filename)
+
+	assert e.value.filename == str(filename)
+
+	config = config_file.read_lines()
+	filename.write_lines([*config, "unknown_key: 1234"])
+
+	with pytest.raises(jsonschema.ValidationError, match="Additional properties are not allowed"):
+		DemoParser().run(filename)
+
+
+@pytest.mark.parametrize("have_fastjsonschema", [True, False])
+def test_parser_schema_validation(
+		tmp_pathplus: PathPlus,
+		monkeypatch: pytest.MonkeyPatch,
+		have_fastjsonschema: bool,
+		):
+	if have_fastjsonschema:
+		pytest.importorskip("fastjsonschema")
+	else:
+		# Importing a module set to None in sys.modules raises ImportError.
+		monkeypatch.setitem(sys.modules, "fastjsonschema", None)
+
+	filename = tmp_pathplus / "config_file.yml"
+	config = config_file.read_lines()
+
+	_get_schema_validator.cache_clear()
+
+	try:
+		# Without fastjsonschema this is the bound validate method of the jsonschema validator.
+		validate = _get_schema_validator(tuple(DemoParser.config_vars), False)
+		assert hasattr(validate, "__self__") is not have_fastjsonschema
+
+		filename.write_lines(config)
+		assert DemoParser().run(filename)["modname"] == "configconfig"
+
+		filename.write_lines(["modname: 1234" if line.startswith("modname:") else line for line in config])
+		with pytest.raises(jsonschema.ValidationError, match="1234 is not of type 'string'"):
+			DemoParser().run(filename)
+
+	finally:
+		_get_schema_validator.cache_clear()
+
+
+class license(ConfigVar):  # noqa: A001
+	"""
+	The license of the project.
+	"""
+
+	dtype = str
+	default = "MIT"
+
+	@classmethod
+	def get_schema_entry(cls, schema: Optional[Dict] = None) -> Dict[str, Any]:  # noqa: D102
+		schema = ConfigVarMeta.get_schema_entry(cls, schema)
+		schema["properties"][cls.__name__]["default"] = cls.default
+		return schema
+
+
+class SchemaDefaultParser(DemoParser):
+	config_vars = [*DemoParser.config_vars, license]
+
+	def custom_parsing(
+			self,
+			raw_config_vars: Mapping[str, Any],
+			parsed_config_vars: MutableMapping[str, Any],
+			filename: PathPlus,
+			) -> MutableMapping[str, Any]:
+		parsed_config_vars["raw_keys"] = set(raw_config_vars)
+		return super().custom_parsing(raw_config_vars, parsed_config_vars, filename)
+
+
+@pytest.mark.parametrize("have_fastjsonschema", [True, False])
+def test_parser_schema_defaults(
+		tmp_pathplus: PathPlus,
+		monkeypatch: pytest.MonkeyPatch,
+		have_fastjsonschema: bool,
+		):
+	if have_fastjsonschema:
+		pytest.importorskip("fastjsonschema")
+	else:
+		monkeypatch.setitem(sys.modules, "fastjsonschema", None)
+
+	filename = tmp_pathplus / "config_file.yml"
+	filename.write_lines(config_file.read_lines())
+
+	_get_schema_validator.cache_clear()
+
+	try:
+		# Defaults in the schema must not be written into the document.
+		for _ in range(2):
+			config = SchemaDefaultParser().run(filename)
+			assert "license" not in config["raw_keys"]
+			assert config["license"] == "MIT"
+
+	finally:
+		_get_schema_validator.cache_clear()
+
+
+class VisitorParser(DemoParser):
+
+	def visit_modname(self, raw_config_vars: Dict[str, Any]) -> str:
+		return modname.get(raw_config_vars).upper()
+
+	@staticmethod
+	def visit_author(raw_config_vars: Dict[str, Any]) -> str:
+		return author.get(raw_config_vars).upper()
+
+
+def test_parser_visitors(parsed_config: MutableMapping[str, Any]):
+	parsed_config_vars = VisitorParser().run(config_file)
+	assert parsed_config_vars["modname"] == "CONFIGCONFIG"
+	assert parsed_config_vars["author"] == "DOMINIC DAVIS-FOSTER"
+	assert parsed_config_vars["email"] == parsed_config["email"] == "dominic@davis-foster.co.uk"
+
+
+class InstanceVisitorParser(DemoParser):
+
+	def __init__(self):
+		super().__init__()
+		self.visit_author = lambda raw_config_vars: "from instance"
+
+	def __getattr__(self, name: str) -> Any:
+		if name == "visit_email":
+			return lambda raw_config_vars: "from __getattr__"
+		raise AttributeError(name)
+
+
+def test_parser_instance_visitors():
+	parsed_config_vars = InstanceVisitorParser().run(config_file)
+	assert parsed_config_vars["author"] == "from instance"
+	assert parsed_config_vars["email"] == "from __getattr__"
+	assert parsed_config_vars["modname"] == "configconfig"
+
+
+def test_parser_run_many(tmp_pathplus: PathPlus):
+	config = config_file.read_lines()
+	filenames = []
+
+	for idx in range(5):
+		filename = tmp_pathplus / f"config_file_{idx}.yml"
+		filename.write_lines([*config, "keywords:", f"  - keyword{idx}"])
+		filenames.append(filename)
+
 	parser = DemoParser()
-	filename = PathPlus(__file__).parent / "config_file.yml"
-	data_regression.check(parser.run(filename))
+	results = parser.run_many(filenames, max_workers=3)
+	assert [result["keywords"] for result in results] == [[f"keyword{idx}"] for idx in range(5)]
+	assert results[0] == parser.run(filenames[0])
@@ -1,10 +1,18 @@
+# stdlib
+import json
+from typing import Any, Dict, Optional
+
 # 3rd party
+import jsonschema  # type: ignore[import]
 import pytest
+from domdf_python_tools.paths import PathPlus
 from pytest_regressions.data_regression import DataRegressionFixture
 
 # this package
+from configconfig.configvar import ConfigVar
 from configconfig.metaclass import ConfigVarMeta
 from configconfig.utils import make_schema
+from configconfig.validator import validate_files
 from tests.configuration import (
 		additional_setup_args,
 		author,
@@ -120,3 +128,65 @@ def test_make_schema(data_regression: DataRegressionFixture):
 					tox_testenv_extras,
 					)
 			)
+
+
+class version(ConfigVar):
+	"""
+	The version of the project.
+	"""
+
+	dtype = str
+	required = True
+
+	@classmethod
+	def get_schema_entry(cls, schema: Optional[Dict] = None) -> Dict[str, Any]:  # noqa: D102
+		schema = ConfigVarMeta.get_schema_entry(cls, schema)
+		schema["properties"][cls.__name__]["pattern"] = r"^\d+\.\d+\.\d+$"
+		return schema
+
+
+def test_make_schema_overridden_entry():
+	schema = make_schema(author, version)
+
+	assert schema["properties"]["version"] == {
+			"type": "string",
+			"description": "The version of the project.",
+			"pattern": r"^\d+\.\d+\.\d+$",
+			}
+	assert schema["required"] == ["author", "version"]
+
+	jsonschema.validate({"author": "Joe Bloggs", "version": "1.2.3"}, schema)
+
+	with pytest.raises(jsonschema.ValidationError, match="does not match"):
+		jsonschema.validate({"author": "Joe Bloggs", "version": "latest"}, schema)
+
+
+def test_validate_files(tmp_pathplus: PathPlus):
+	schemafile = tmp_pathplus / "schema.json"
+	schemafile.write_text(json.dumps(make_schema(author, email, platforms)))
+
+	valid = tmp_pathplus / "valid.yml"
+	valid.write_lines([
+			"author: Dominic Davis-Foster",
+			"email: dominic@example.com",
+			"---",
+			"author: Joe Bloggs",
+			"email: joe@example.com",
+			"platforms:",
+			"  - Linux",
+			])
+
+	invalid = tmp_pathplus / "invalid.yml"
+	invalid.write_lines([
+			"author: Dominic Davis-Foster",
+			"email: dominic@example.com",
+			"platforms:",
+			"  - BSD",
+			])
+
+	validate_files(schemafile, valid)
+
+	with pytest.raises(jsonschema.exceptions.ValidationError) as e:
+		validate_files(schemafile, valid, invalid)
+
+	assert e.value.filename == str(invalid)
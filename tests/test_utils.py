@@ -1,13 +1,14 @@
 # stdlib
 from enum import Enum
-from typing import Any, Dict, List, Type, Union
+from typing import Any, Dict, List, Tuple, Type, Union
 
 # 3rd party
 import pytest
 from typing_extensions import Literal
 
 # this package
-from configconfig.utils import check_union, get_json_type, get_yaml_type
+from configconfig.configvar import ConfigVar
+from configconfig.utils import check_union, get_json_type, get_yaml_type, optional_getter
 
 
 def test_check_union():
@@ -71,3 +72,83 @@ def test_get_json_type(value: Type, expects: Dict[str, Any]):
 		)
 def test_get_yaml_type(value: Type, expects: str):
 	assert get_yaml_type(value) == expects
+
+
+@pytest.mark.parametrize(
+		"first, second, yaml_types, json_types",
+		[
+				(
+						Union[str, int],
+						Union[int, str],
+						("String or Integer", "Integer or String"),
+						({"type": ["string", "number"]}, {"type": ["number", "string"]}),
+						),
+				(
+						Literal["a", "b"],
+						Literal["b", "a"],
+						("'a' or 'b'", "'b' or 'a'"),
+						({"enum": ["a", "b"]}, {"enum": ["b", "a"]}),
+						),
+				]
+		)
+def test_type_argument_order(
+		first: Type,
+		second: Type,
+		yaml_types: Tuple[str, str],
+		json_types: Tuple[Dict[str, Any], Dict[str, Any]],
+		):
+	# typing considers the two types equal, but each result must follow the declared order.
+	assert (get_yaml_type(first), get_yaml_type(second)) == yaml_types
+	assert (get_json_type(first), get_json_type(second)) == json_types
+
+
+@pytest.mark.parametrize(
+		"default",
+		[
+				'',
+				"abc",
+				1234,
+				None,
+				[],
+				["abc", 1234],
+				{"abc": 1234},
+				[["abc"], {"abc": [1234]}],
+				{"abc": ["def"]},
+				],
+		)
+def test_optional_getter_default(default: Any):
+
+	class my_var(ConfigVar):
+		dtype = Any
+
+	my_var.default = default
+
+	value = optional_getter({}, my_var, False)
+	assert value == default
+	assert optional_getter({"my_var": "xyz"}, my_var, False) == "xyz"
+
+	if isinstance(default, list):
+		assert value is not default
+		assert all(a is not b for a, b in zip(value, default) if isinstance(b, (list, dict)))
+	elif isinstance(default, dict):
+		assert value is not default
+		assert all(value[k] is not v for k, v in default.items() if isinstance(v, (list, dict)))
+
+	my_var.default = lambda raw_config_vars: default
+	value = optional_getter({}, my_var, False)
+	assert value == default
+
+	if isinstance(default, (list, dict)):
+		assert value is not default
+
+
+def test_optional_getter_required():
+
+	class my_var(ConfigVar):
+		dtype = str
+		required = True
+
+	assert optional_getter({"my_var": "xyz"}, my_var, True) == "xyz"
+
+	with pytest.raises(ValueError, match="A value for 'my_var' is required."):
+		optional_getter({}, my_var, True)